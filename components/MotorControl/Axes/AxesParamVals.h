@@ -63,6 +63,17 @@ public:
             return _vals[axisIdx];
         return 0;
     }
+    bool operator==(const AxesParamVals& other) const
+    {
+        for (uint32_t i = 0; i < AXIS_VALUES_MAX_AXES; i++)
+            if (_vals[i] != other._vals[i])
+                return false;
+        return true;
+    }
+    bool operator!=(const AxesParamVals& other) const
+    {
+        return !(*this == other);
+    }
     T vectorMultSum(AxesParamVals<T> other)
     {
         T result = 0;
@@ -44,6 +44,9 @@ public:
     AxisPosDataType _homeOffsetVal;
     AxisStepsDataType _homeOffSteps;
 
+    // Cached steps per unit (derived from _stepsPerRot/_unitsPerRot)
+    AxisStepsFactorDataType _stepsPerUnit;
+
   public:
     AxisParams()
     {
@@ -67,13 +70,22 @@ public:
         _isServoAxis = false;
         _homeOffsetVal = homeOffsetVal_default;
         _homeOffSteps = homeOffSteps_default;
+        updateStepsPerUnit();
     }
 
+    // Steps per unit is fixed once the axis is configured so the ratio is
+    // cached rather than recomputed on every coordinate conversion
     AxisStepsFactorDataType stepsPerUnit() const
+    {
+        return _stepsPerUnit;
+    }
+
+    void updateStepsPerUnit()
     {
         if (_unitsPerRot != 0)
-            return _stepsPerRot / _unitsPerRot;
-        return 1;
+            _stepsPerUnit = _stepsPerRot / _unitsPerRot;
+        else
+            _stepsPerUnit = 1;
     }
 
     bool ptInBounds(AxisPosDataType &val, bool correctValueInPlace) const
@@ -109,6 +121,7 @@ public:
         _isDominantAxis = RaftJson::getBool("isDominantAxis", 0, axisJSON);
         _isPrimaryAxis = RaftJson::getBool("isPrimaryAxis", 1, axisJSON);
         _isServoAxis = RaftJson::getBool("isServoAxis", 0, axisJSON);
+        updateStepsPerUnit();
     }
 
     void debugLog(int axisIdx)
@@ -12,25 +12,28 @@
 double AxisUtils::cosineRule(double a, double b, double c)
 {
     // Calculate angle C of a triangle using the cosine rule
-    // LOG_V(MODULE_PREFIX, "cosineRule a %f b %f c %f acos %f = %f",
-    //         a, b, c, (a*a + b*b - c*c) / (2 * a * b), acos((a*a + b*b - c*c) / (2 * a * b)));
-    double val = (a*a + b*b - c*c) / (2 * a * b);
-    if (val > 1) val = 1;
-    if (val < -1) val = -1;
-    return acos(val);
+    // Formulated as atan2(2ab.sin(C), 2ab.cos(C)) with the sine term derived
+    // from the triangle's area - this avoids acos of a clamped cosine and is
+    // more accurate where the cosine saturates at +/-1 (angles near 0 or pi)
+    double cosTerm = a*a + b*b - c*c;               // 2ab.cos(C)
+    double sinTermSq = 4*a*a*b*b - cosTerm*cosTerm; // (2ab.sin(C))^2
+    double sinTerm = sinTermSq > 0 ? sqrt(sinTermSq) : 0;
+    return atan2(sinTerm, cosTerm);
 }
 
 double AxisUtils::wrapRadians( double angle )
 {
     static const double twoPi = 2.0 * M_PI;
-    // LOG_V(MODULE_PREFIX, "wrapRadians %f %f", angle, angle - twoPi * floor( angle / twoPi ));
-    return angle - twoPi * floor( angle / twoPi );
+    static const double recipTwoPi = 1.0 / (2.0 * M_PI);
+    // LOG_V(MODULE_PREFIX, "wrapRadians %f %f", angle, angle - twoPi * floor( angle * recipTwoPi ));
+    return angle - twoPi * floor( angle * recipTwoPi );
 }
 
 double AxisUtils::wrapDegrees( double angle )
 {
-    // LOG_V(MODULE_PREFIX, "wrapDegrees %f %f", angle, angle - 360 * floor( angle / 360 ));
-    return angle - 360.0 * floor( angle / 360.0 );
+    static const double recip360 = 1.0 / 360.0;
+    // LOG_V(MODULE_PREFIX, "wrapDegrees %f %f", angle, angle - 360 * floor( angle * recip360 ));
+    return angle - 360.0 * floor( angle * recip360 );
 }
 
 double AxisUtils::r2d(double angleRadians)
@@ -53,7 +56,11 @@ bool AxisUtils::isApprox(double v1, double v2, double withinRng)
 bool AxisUtils::isApproxWrap(double v1, double v2, double wrapSize, double withinRng)
 {
     // LOG_V(MODULE_PREFIX, "isApprox %f %f = %d", v1, v2, fabs(v1 - v2) < withinRng);
-    double t1 = v1 - wrapSize * floor(v1 / wrapSize);
-    double t2 = v2 - wrapSize * floor(v2 / wrapSize);
-    return (fabs(t1 - t2) < withinRng) || (fabs(t1 - wrapSize - t2) < withinRng) || (fabs(t1 + wrapSize - t2) < withinRng);
+    double recipWrapSize = 1.0 / wrapSize;
+    double t1 = v1 - wrapSize * floor(v1 * recipWrapSize);
+    double t2 = v2 - wrapSize * floor(v2 * recipWrapSize);
+    // Both values are wrapped into [0, wrapSize) so the difference is in (-wrapSize, wrapSize)
+    // and the two +/- wrapSize cases collapse into a single check on the absolute difference
+    double absDiff = fabs(t1 - t2);
+    return (absDiff < withinRng) || (wrapSize - absDiff < withinRng);
 }
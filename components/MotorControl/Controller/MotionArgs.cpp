@@ -7,12 +7,14 @@
 /////////////////////////////////////////////////////////////////////////////////////////////////////////////////
 
 #include "MotionArgs.h"
+#include <string.h>
 
 static const char* MODULE_PREFIX = "MotionArgs";
 
 std::vector<MotionArgs::FieldDefType> MotionArgs::getFieldDefs()
 {
     std::vector<FieldDefType> fieldDefs;
+    fieldDefs.reserve(21);
     fieldDefs.push_back(FieldDefType("rel", &_isRelative, "bool"));
     fieldDefs.push_back(FieldDefType("lin", &_linearNoRamp, "bool"));
     fieldDefs.push_back(FieldDefType("steps", &_unitsAreSteps, "bool"));
@@ -41,6 +43,11 @@ void MotionArgs::fromJSON(const char* jsonStr)
 {
     // Get json
     JSONParams cmdJson(jsonStr);
+    fromJSON(cmdJson);
+}
+
+void MotionArgs::fromJSON(const JSONParams& cmdJson)
+{
     clear();
 
     // Get field definitions
@@ -50,18 +57,18 @@ void MotionArgs::fromJSON(const char* jsonStr)
     for (auto &fieldDef : fieldDefs)
     {
         // Check if value is present
-        if (!cmdJson.contains(fieldDef._name.c_str()))
+        if (!cmdJson.contains(fieldDef._name))
             continue;
 
         // Get value
-        if (fieldDef._dataType.equalsIgnoreCase("bool"))
+        if (strcasecmp(fieldDef._dataType, "bool") == 0)
         {
-            bool fieldVal = cmdJson.getBool(fieldDef._name.c_str(), 0);
+            bool fieldVal = cmdJson.getBool(fieldDef._name, 0);
             *((bool*)fieldDef._pValue) = fieldVal;
         }
-        else if (fieldDef._dataType.equalsIgnoreCase("double"))
+        else if (strcasecmp(fieldDef._dataType, "double") == 0)
         {
-            double fieldVal = cmdJson.getDouble(fieldDef._name.c_str(), 0);
+            double fieldVal = cmdJson.getDouble(fieldDef._name, 0);
             *((double*)fieldDef._pValue) = fieldVal;
         }
     }
@@ -128,13 +135,13 @@ String MotionArgs::toJSON()
     for (auto &fieldDef : fieldDefs)
     {
         // Get value
-        if (fieldDef._dataType.equalsIgnoreCase("bool"))
+        if (strcasecmp(fieldDef._dataType, "bool") == 0)
         {
-            jsonStr += "\"" + fieldDef._name + "\":" + String(*((bool*)fieldDef._pValue)) + ",";
+            jsonStr += "\"" + String(fieldDef._name) + "\":" + String(*((bool*)fieldDef._pValue)) + ",";
         }
-        else if (fieldDef._dataType.equalsIgnoreCase("double"))
+        else if (strcasecmp(fieldDef._dataType, "double") == 0)
         {
-            jsonStr += "\"" + fieldDef._name + "\":" + String(*((double*)fieldDef._pValue)) + ",";
+            jsonStr += "\"" + String(fieldDef._name) + "\":" + String(*((double*)fieldDef._pValue)) + ",";
         }
     }
 
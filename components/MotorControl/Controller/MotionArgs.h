@@ -345,6 +345,7 @@ public:
     // }
 
     void fromJSON(const char* jsonStr);
+    void fromJSON(const JSONParams& cmdJson);
     String toJSON();
 
     // String toJSON(bool includeBraces = true)
@@ -402,9 +403,11 @@ private:
             _pValue = pValue;
             _dataType = dataType;
         }
-        String _name;
+        // Names and types are string literals so plain pointers avoid a pair
+        // of String allocations per field every time the defs are built
+        const char* _name;
         void* _pValue;
-        String _dataType;
+        const char* _dataType;
     };
     std::vector<FieldDefType> getFieldDefs();
 
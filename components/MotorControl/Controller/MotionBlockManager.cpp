@@ -123,6 +123,11 @@ bool MotionBlockManager::addRampedBlock(const MotionArgs& args,
 
 void MotionBlockManager::pumpBlockSplitter(MotionPipelineIF& motionPipeline)
 {
+    // Early-out if no split is in progress - this is called on every service
+    // loop so avoid querying the pipeline when there is nothing to add
+    if (_numBlocks == 0)
+        return;
+
     // Check if we can add anything to the pipeline
     while (motionPipeline.canAccept())
     {
@@ -55,6 +55,9 @@ void MotionController::setup(const ConfigBase& config, const char* pConfigPrefix
     // Teardown first
     teardown();
 
+    // Axis params may change so drop the cached monitored position
+    _lastMonitoredPosValid = false;
+
     // Setup axes (and associated hardware)
     setupAxes(config, pConfigPrefix);
 #ifdef INFO_LOG_AXES_PARAMS
@@ -622,9 +625,17 @@ AxesPosValues MotionController::getLastMonitoredPos() const
     // Get current position
     AxesParamVals<AxisStepsDataType> curActuatorPos;
     _rampGenerator.getTotalStepPosition(curActuatorPos);
+    // Avoid re-doing the reverse kinematics if the actuator position is unchanged
+    // (e.g. x, y and z polled separately in a single status pass)
+    if (_lastMonitoredPosValid && (curActuatorPos == _lastMonitoredActuatorPos))
+        return _lastMonitoredPos;
     // Use reverse kinematics to get location
     AxesPosValues lastMonitoredPos;
     _blockManager.coordsActuatorToRealWorld(curActuatorPos, lastMonitoredPos);
+    // Cache for repeated queries
+    _lastMonitoredActuatorPos = curActuatorPos;
+    _lastMonitoredPos = lastMonitoredPos;
+    _lastMonitoredPosValid = true;
     return lastMonitoredPos;
 }
 
@@ -114,6 +114,12 @@ private:
     // Pause status
     bool _isPaused = false;
 
+    // Cache of last monitored position (reverse kinematics is only recomputed
+    // when the actuator position changes)
+    mutable AxesParamVals<AxisStepsDataType> _lastMonitoredActuatorPos;
+    mutable AxesPosValues _lastMonitoredPos;
+    mutable bool _lastMonitoredPosValid = false;
+
     // Helpers
     void deinit();
     void setupAxes(const ConfigBase& config, const char* pConfigPrefix);
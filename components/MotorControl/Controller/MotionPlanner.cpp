@@ -163,6 +163,7 @@ bool MotionPlanner::moveToRamped(const MotionArgs& args,
     bool isAMove = false;
     bool isAPrimaryMove = false;
     int axisWithMaxMoveDist = 0;
+    float maxAbsMoveDist = 0;
     float squareSum = 0;
     for (int axisIdx = 0; axisIdx < AXIS_VALUES_MAX_AXES; axisIdx++)
     {
@@ -172,12 +173,17 @@ bool MotionPlanner::moveToRamped(const MotionArgs& args,
             isAMove = true;
             if (axesParams.isPrimaryAxis(axisIdx))
             {
-                squareSum += pow(deltas[axisIdx], 2);
+                squareSum += deltas[axisIdx] * deltas[axisIdx];
                 isAPrimaryMove = true;
             }
         }
-        if (fabs(deltas[axisIdx]) > fabs(deltas[axisWithMaxMoveDist]))
+        // Track the max absolute delta so it isn't recomputed on every pass
+        float absDelta = fabs(deltas[axisIdx]);
+        if (absDelta > maxAbsMoveDist)
+        {
+            maxAbsMoveDist = absDelta;
             axisWithMaxMoveDist = axisIdx;
+        }
     }
 
     // Distance being moved
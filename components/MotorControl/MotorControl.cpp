@@ -169,8 +169,9 @@ RaftRetCode MotorControl::sendCmdJSON(const char* cmdJSON)
     String cmd = jsonInfo.getString("cmd", "");
     if (cmd.equalsIgnoreCase("motion"))
     {
+        // Re-use the already-parsed JSON rather than parsing the string again
         MotionArgs motionArgs;
-        motionArgs.fromJSON(cmdJSON);
+        motionArgs.fromJSON(jsonInfo);
 #ifdef DEBUG_STEPPER_CMD_JSON
         String cmdStr = motionArgs.toJSON();
         LOG_I(MODULE_PREFIX, "sendCmdJSON %s", cmdStr.c_str());
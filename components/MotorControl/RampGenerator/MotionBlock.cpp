@@ -187,13 +187,14 @@ bool MotionBlock::prepareForStepping(const AxesParams &axesParams, bool isLinear
     else
     {
         // Get the initial step rate, final step rate and max acceleration for the axis with max steps
+        float maxAxisStepRatePerSec = axesParams.getMaxStepRatePerSec(_axisIdxWithMaxSteps);
         stepDistMM = fabs(_moveDistPrimaryAxesMM / _stepsTotalMaybeNeg[_axisIdxWithMaxSteps]);
         initialStepRatePerSec = fabs(_entrySpeedMMps / stepDistMM);
-        if (initialStepRatePerSec > axesParams.getMaxStepRatePerSec(_axisIdxWithMaxSteps))
-            initialStepRatePerSec = axesParams.getMaxStepRatePerSec(_axisIdxWithMaxSteps);
+        if (initialStepRatePerSec > maxAxisStepRatePerSec)
+            initialStepRatePerSec = maxAxisStepRatePerSec;
         finalStepRatePerSec = fabs(_exitSpeedMMps / stepDistMM);
-        if (finalStepRatePerSec > axesParams.getMaxStepRatePerSec(_axisIdxWithMaxSteps))
-            finalStepRatePerSec = axesParams.getMaxStepRatePerSec(_axisIdxWithMaxSteps);
+        if (finalStepRatePerSec > maxAxisStepRatePerSec)
+            finalStepRatePerSec = maxAxisStepRatePerSec;
         maxAccStepsPerSec2 = fabs(axesParams.getMaxAccel(_axisIdxWithMaxSteps) / stepDistMM);
 
         // Calculate the distance decelerating and ensure within bounds
@@ -204,7 +205,7 @@ bool MotionBlock::prepareForStepping(const AxesParams &axesParams, bool isLinear
         // And solving for Saccelerating (distance accelerating)
         uint32_t stepsAccelerating = 0;
         float stepsAcceleratingFloat =
-            ceilf((powf(finalStepRatePerSec, 2) - powf(initialStepRatePerSec, 2)) / 4 /
+            ceilf((finalStepRatePerSec * finalStepRatePerSec - initialStepRatePerSec * initialStepRatePerSec) / 4 /
                         maxAccStepsPerSec2 +
                     absMaxStepsForAnyAxis / 2);
         if (stepsAcceleratingFloat > 0)
@@ -219,12 +220,12 @@ bool MotionBlock::prepareForStepping(const AxesParams &axesParams, bool isLinear
 
         // Find max possible rate for axis with max steps
         axisMaxStepRatePerSec = fabs(_requestedVelocity / stepDistMM);
-        if (axisMaxStepRatePerSec > axesParams.getMaxStepRatePerSec(_axisIdxWithMaxSteps))
-            axisMaxStepRatePerSec = axesParams.getMaxStepRatePerSec(_axisIdxWithMaxSteps);
+        if (axisMaxStepRatePerSec > maxAxisStepRatePerSec)
+            axisMaxStepRatePerSec = maxAxisStepRatePerSec;
 
         // See if max speed will be reached
         uint32_t stepsToMaxSpeed =
-            uint32_t((powf(axisMaxStepRatePerSec, 2) - powf(initialStepRatePerSec, 2)) /
+            uint32_t((axisMaxStepRatePerSec * axisMaxStepRatePerSec - initialStepRatePerSec * initialStepRatePerSec) /
                         2 / maxAccStepsPerSec2);
         if (stepsAccelerating > stepsToMaxSpeed)
         {
@@ -233,14 +234,14 @@ bool MotionBlock::prepareForStepping(const AxesParams &axesParams, bool isLinear
 
             // Decelerating steps
             stepsDecelerating =
-                uint32_t((powf(axisMaxStepRatePerSec, 2) - powf(finalStepRatePerSec, 2)) /
+                uint32_t((axisMaxStepRatePerSec * axisMaxStepRatePerSec - finalStepRatePerSec * finalStepRatePerSec) /
                             2 / maxAccStepsPerSec2);
         }
         else
         {
             // Calculate max speed that will be reached
             axisMaxStepRatePerSec =
-                sqrtf(powf(initialStepRatePerSec, 2) + 2.0F * maxAccStepsPerSec2 * stepsAccelerating);
+                sqrtf(initialStepRatePerSec * initialStepRatePerSec + 2.0F * maxAccStepsPerSec2 * stepsAccelerating);
 
             // Decelerating steps
             stepsDecelerating = absMaxStepsForAnyAxis - stepsAccelerating;
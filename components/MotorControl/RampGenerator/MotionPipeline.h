@@ -22,7 +22,8 @@ public:
     }
 
     // Clear the pipeline
-    virtual void clear() override final
+    // Called from the ISR when a stop is pending so must be in IRAM
+    virtual void IRAM_ATTR clear() override final
     {
         _pipelinePosn.clear();
     }
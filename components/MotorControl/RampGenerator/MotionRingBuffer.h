@@ -29,7 +29,7 @@ class MotionRingBufferPosn
         _getPos = 0;
     }
 
-    void clear()
+    inline void IRAM_ATTR clear()
     {
         _getPos = 0;
         _putPos = 0;
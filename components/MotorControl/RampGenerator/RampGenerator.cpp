@@ -91,6 +91,10 @@ void RampGenerator::setup(const ConfigBase& config, const char* pConfigPrefix,
     // Calculate ramp gen periods
     _minStepRatePerTTicks = MotionBlock::calcMinStepRatePerTTicks(_stepGenPeriodNs);
 
+    // Pre-calculate the number of pulse-generation calls needed per non-timer
+    // service to give the equivalent of the timer rate
+    _nonTimerNumPulseCalls = (NON_TIMER_SERVICE_CALL_MIN_MS * 1000) / (_stepGenPeriodNs / 1000);
+
     // Hook the timer if required
     if (_useRampGenTimer)
         _rampGenTimer.hookTimer(rampGenTimerCallback, this);
@@ -120,12 +124,12 @@ void RampGenerator::service()
     if (!_useRampGenTimer)
     {
         // Check time to generate pulses
-        if (Raft::isTimeout(millis(), _nonTimerServiceLastMs, NON_TIMER_SERVICE_CALL_MIN_MS))
+        uint32_t timeNowMs = millis();
+        if (Raft::isTimeout(timeNowMs, _nonTimerServiceLastMs, NON_TIMER_SERVICE_CALL_MIN_MS))
         {
-            _nonTimerServiceLastMs = millis();
-            // Calculate times to call to give equivalent to timer rate
-            uint32_t numCalls = (NON_TIMER_SERVICE_CALL_MIN_MS * 1000) / (_stepGenPeriodNs / 1000);
-            for (uint32_t i = 0; i < numCalls; i++)
+            _nonTimerServiceLastMs = timeNowMs;
+            // Number of calls to give equivalent to timer rate (pre-calculated in setup)
+            for (uint32_t i = 0; i < _nonTimerNumPulseCalls; i++)
                 generateMotionPulses();
         }
     }
@@ -112,6 +112,7 @@ private:
 
     // Non-timer service rate
     uint32_t _nonTimerServiceLastMs = 0;
+    uint32_t _nonTimerNumPulseCalls = 0;
 
     // Steppers
     std::vector<StepDriverBase*> _stepperDrivers;
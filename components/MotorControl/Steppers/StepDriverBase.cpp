@@ -244,21 +244,32 @@ void StepDriverBase::startReadTrinamicsRegister(uint32_t readRegisterIdx)
 
 uint8_t StepDriverBase::calcTrinamicsCRC(const uint8_t* pData, uint32_t len)
 {
+    // Table-driven form of the TMC CRC8 (poly 0x07 with datagram bytes
+    // processed LSB-first) - the table is built once on first use instead of
+    // running 8 shift/XOR steps per byte on every datagram
+    static uint8_t crcTable[256];
+    static bool crcTableBuilt = false;
+    if (!crcTableBuilt)
+    {
+        for (uint32_t i = 0; i < 256; i++)
+        {
+            uint8_t crc = i;
+            for (uint32_t j = 0; j < 8; j++)
+                crc = (crc & 0x80) ? (crc << 1) ^ 0x07 : (crc << 1);
+            crcTable[i] = crc;
+        }
+        crcTableBuilt = true;
+    }
+
     uint8_t crc = 0;
     for (uint32_t i = 0; i < len; i++)
     {
+        // Reverse the bit order as the bits enter the CRC LSB-first
         uint8_t currentByte = pData[i];
-        for (uint32_t j = 0; j < 8; j++)
-        {
-            // update CRC based result of XOR operation
-            if ((crc >> 7) ^ (currentByte & 0x01)) {
-                crc = (crc << 1) ^ 0x07;
-            } else {
-                crc = (crc << 1);
-            }
-            crc &= 0xff;
-            currentByte = currentByte >> 1;
-        }
+        currentByte = ((currentByte & 0x55) << 1) | ((currentByte & 0xaa) >> 1);
+        currentByte = ((currentByte & 0x33) << 2) | ((currentByte & 0xcc) >> 2);
+        currentByte = (currentByte << 4) | (currentByte >> 4);
+        crc = crcTable[crc ^ currentByte];
     }
     return crc;
 }